@@ -1,31 +1,36 @@
 import os
-import time
 import re
-import json
 import random
-import shutil
+import asyncio
 from datetime import datetime
+import aiohttp
 import pandas as pd
-from collections import Counter
+import pyarrow as pa
+import pyarrow.csv
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 # ---------------- CONFIG ----------------
 HEADLESS = False  # Set True for background
+CONCURRENCY = 20  # max keyword pages loading at once
+IMAGE_WORKERS = 16  # image downloads drain a queue concurrently with scraping
 SOURCE_PLATFORM = "Ajio"
 OUT_PREFIX = "ajio"
 TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
 OUTPUT_DIR = os.path.join(os.getcwd(), f"{OUT_PREFIX}_scrape_{TIMESTAMP}")
 IMAGES_DIR = os.path.join(OUTPUT_DIR, "images")
 CSV_FILENAME = os.path.join(OUTPUT_DIR, f"{OUT_PREFIX}_products_{TIMESTAMP}.csv")
-JSON_FILENAME = os.path.join(OUTPUT_DIR, f"{OUT_PREFIX}_products_{TIMESTAMP}.json")
-SCROLL_PAUSE_TIME = 2
+PARQUET_FILENAME = os.path.join(OUTPUT_DIR, f"{OUT_PREFIX}_products_{TIMESTAMP}.parquet")
 MAX_SCROLL_TRIES = 80
 NO_GROWTH_CYCLES = 5
 DOWNLOAD_IMAGES = True
 
+# The search page populates its grid from this JSON endpoint (visible in
+# DevTools -> Network); hitting it directly skips Chromium entirely.
+API_SEARCH_URL = "https://www.ajio.com/api/search"
+API_PAGE_SIZE = 45
+
 # ---------------- KEYWORDS ----------------
 keywords_map = {
     "Shoes": {
@@ -44,50 +49,51 @@ keywords_map = {
     }
 }
 
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 Version/15.0 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/118.0"
+]
+
 console = Console()
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(IMAGES_DIR, exist_ok=True)
 
 # ---------------- UTILITIES ----------------
-def clean_text(text):
-    return re.sub(r'\s+', ' ', text.strip()) if text else ""
+# Compiled once; these run on several fields of every product
+_WS = re.compile(r'\s+')
+_NONDIGIT = re.compile(r'[^\d.]')
+_NONALNUM_SPACE = re.compile(r'[^a-zA-Z0-9\s]')
 
-def extract_price(price_text):
-    if not price_text:
-        return None
-    cleaned = re.sub(r'[^\d.]', '', price_text.replace(',', ''))
-    return float(cleaned) if cleaned else None
+_created_dirs = set()
+
+def _ensure_dir(path):
+    """mkdir once per folder; only a handful of (category, gender) dirs exist."""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+def clean_text(text):
+    return _WS.sub(' ', text.strip()) if text else ""
 
 def generate_image_names(product_name, brand, category="Shoes", gender="Men"):
-    clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', (product_name or "").lower())
-    clean_name = re.sub(r'\s+', '-', clean_name)[:60]
-    clean_brand = re.sub(r'[^a-zA-Z0-9\s]', '', (brand or "nobrand").lower())
-    clean_brand = re.sub(r'\s+', '-', clean_brand)[:30]
+    clean_name = _NONALNUM_SPACE.sub('', (product_name or "").lower())
+    clean_name = _WS.sub('-', clean_name)[:60]
+    clean_brand = _NONALNUM_SPACE.sub('', (brand or "nobrand").lower())
+    clean_brand = _WS.sub('-', clean_brand)[:30]
     folder_path = os.path.join(IMAGES_DIR, category, gender)
-    os.makedirs(folder_path, exist_ok=True)
+    _ensure_dir(folder_path)
     image_name = f"{clean_name}-{clean_brand}.jpg"
     relative_path = os.path.join("images", category, gender, image_name)
     return folder_path, image_name, relative_path
 
-def download_image(playwright_page, image_url, folder_path, filename):
-    """Download image using Playwright (avoids bot block)"""
-    try:
-        local_path = os.path.join(folder_path, filename)
-        if os.path.exists(local_path):
-            return local_path
-        content = playwright_page.evaluate(
-            """async (url) => {
-                const response = await fetch(url);
-                const buffer = await response.arrayBuffer();
-                return Array.from(new Uint8Array(buffer));
-            }""",
-            image_url,
-        )
-        with open(local_path, "wb") as f:
-            f.write(bytearray(content))
-        return local_path
-    except:
-        return None
+# Output schema; results accumulate as one list per field (SoA) so the
+# final DataFrame is built without per-row dict inference
+FIELDS = (
+    "product_id", "category", "gender", "product_url", "product_name",
+    "brand", "price", "original_price", "discount_percent", "rating",
+    "reviews", "price_tier", "image_url", "image_path", "source_platform"
+)
 
 def parse_product(el, category="Shoes", gender="Men"):
     pdata = {
@@ -97,8 +103,9 @@ def parse_product(el, category="Shoes", gender="Men"):
         "product_url": el.get("href", ""),
         "product_name": clean_text(el.get("name", "")),
         "brand": clean_text(el.get("brand", "")),
-        "price": extract_price(el.get("price")),
-        "original_price": extract_price(el.get("original_price")),
+        # raw price text; parsed column-wise once the DataFrame is built
+        "price": el.get("price") or "",
+        "original_price": el.get("original_price") or "",
         "discount_percent": clean_text(el.get("discount", "")),
         "rating": clean_text(el.get("rating", "")) or "0",
         "reviews": clean_text(el.get("reviews", "")) or "0",
@@ -112,113 +119,338 @@ def parse_product(el, category="Shoes", gender="Men"):
     if "/p/" in pdata["product_url"]:
         pdata["product_id"] = pdata["product_url"].split("/p/")[-1].split("?")[0]
 
-    # Price tier
-    p = pdata["price"]
-    if p is None:
-        pdata["price_tier"] = "unknown"
-    elif p < 3000:
-        pdata["price_tier"] = "affordable"
-    elif p < 8000:
-        pdata["price_tier"] = "mid"
-    else:
-        pdata["price_tier"] = "expensive"
-
     return pdata
 
+# ---------------- IMAGE DOWNLOADS ----------------
+def make_session():
+    """One pooled aiohttp session for API pages and image downloads."""
+    connector = aiohttp.TCPConnector(limit=50, limit_per_host=16, ttl_dns_cache=300)
+    headers = {"User-Agent": random.choice(USER_AGENTS), "Accept": "application/json"}
+    return aiohttp.ClientSession(connector=connector, headers=headers)
+
+async def download_image_http(session, image_url, folder_path, filename):
+    """Download one image over HTTP; keep-alive comes from the shared session."""
+    try:
+        local_path = os.path.join(folder_path, filename)
+        if os.path.exists(local_path):
+            return local_path
+        async with session.get(image_url) as resp:
+            if resp.status != 200:
+                return None
+            content = await resp.read()
+        with open(local_path, "wb") as f:
+            f.write(content)
+        return local_path
+    except:
+        return None
+
+async def img_worker(session, img_queue, stats):
+    """Drain (url, folder, name, relative, pdata) tuples while scraping runs.
+
+    Downloads happen concurrently with the next keyword's scroll and
+    extraction, so end-to-end time approaches max(scrape, images)
+    instead of their sum. Marks image_path on each pdata whose download
+    succeeded.
+    """
+    while True:
+        url, folder, name, relative_path, pdata = await img_queue.get()
+        try:
+            local_path = await download_image_http(session, url, folder, name)
+            if local_path:
+                stats["images"] += 1
+                pdata["image_path"] = relative_path
+        finally:
+            img_queue.task_done()
+
+# ---------------- JSON API SCRAPER ----------------
+def _api_product_to_el(prod):
+    """Map one product dict from the search API onto parse_product's keys."""
+    images = prod.get("images") or [{}]
+    return {
+        "href": prod.get("url", ""),
+        "name": prod.get("name", ""),
+        "brand": (prod.get("brand") or {}).get("name", ""),
+        "price": str((prod.get("price") or {}).get("value", "")),
+        "original_price": str((prod.get("wasPriceData") or {}).get("value", "")),
+        "discount": str(prod.get("discountPercent", "")),
+        "rating": "",
+        "reviews": "",
+        "image": images[0].get("url", "")
+    }
+
+async def fetch_keyword_api(session, semaphore, seen_ids, img_queue, category, gender, keyword):
+    """Fetch one keyword from the JSON search API, paginated by currentPage.
+
+    Raises on HTTP errors (e.g. 403) so the caller can fall back to the
+    Playwright path for that keyword.
+    """
+    async with semaphore:
+        products = []
+        failed_extractions = 0
+        page_num = 0
+        total_pages = 1
+        console.print(f"[bold yellow]API fetch:[/bold yellow] {keyword}")
+
+        while page_num < total_pages:
+            params = {
+                "fields": "SITE",
+                "currentPage": page_num,
+                "pageSize": API_PAGE_SIZE,
+                "format": "json",
+                "query": f"{keyword.replace('+', ' ')}:relevance"
+            }
+            async with session.get(API_SEARCH_URL, params=params) as resp:
+                resp.raise_for_status()
+                data = await resp.json()
+
+            rows = data.get("products") or []
+            if not rows:
+                # an empty *first* page means the endpoint or response
+                # shape is not what we guessed, not a real zero-result
+                # search; raise so the browser path handles the keyword
+                if page_num == 0:
+                    raise RuntimeError(f"no products in API response for '{keyword}'")
+                break
+            total_pages = (data.get("pagination") or {}).get("totalPages", page_num + 1)
+
+            for prod in rows:
+                # skeleton entries carry no name; skip before building the
+                # full dict and running the clean-up regexes on it
+                if not (prod.get("name") or "").strip():
+                    failed_extractions += 1
+                    continue
+                pdata = parse_product(_api_product_to_el(prod), category, gender)
+
+                # related keywords return heavily overlapping tiles; skip
+                # repeats before any image-path or download work happens
+                if pdata["product_id"]:
+                    if pdata["product_id"] in seen_ids:
+                        continue
+                    seen_ids.add(pdata["product_id"])
+
+                if DOWNLOAD_IMAGES and pdata.get("image_url"):
+                    folder_path, img_name, relative_path = generate_image_names(
+                        pdata["product_name"], pdata["brand"], category, gender
+                    )
+                    img_queue.put_nowait((pdata["image_url"], folder_path, img_name, relative_path, pdata))
+
+                products.append(pdata)
+            page_num += 1
+
+        console.print(f"[bold blue]{keyword}: {len(products)} products (API)[/bold blue]")
+        return products, failed_extractions
+
 # ---------------- SCRAPER ----------------
-def scrape_ajio():
-    all_products = []
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+BLOCKED_DOMAINS = ("google-analytics", "googletagmanager", "doubleclick", "segment")
+
+async def block_heavy_requests(route):
+    """Abort image/font/media/tracker requests; extraction only needs the DOM.
+
+    Image URLs are still read from the tiles' src attributes and
+    downloaded separately over aiohttp, so product images are
+    unaffected.
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(d in request.url for d in BLOCKED_DOMAINS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+ITEM_COUNT_JS = "document.querySelectorAll('div.rilrtl-products-list__item').length"
+
+# Walks all product tiles inside the page and returns already-extracted
+# fields in one call, instead of ~9 query_selector round-trips per tile.
+EXTRACT_ITEMS_JS = """() => Array.from(document.querySelectorAll('div.rilrtl-products-list__item')).map(it => {
+    const q = (s) => it.querySelector(s);
+    const t = (e) => e ? e.innerText : '';
+    const a = (e, x) => e ? (e.getAttribute(x) || '') : '';
+    return {
+        href: a(q('a.rilrtl-products-list__link.desktop'), 'href'),
+        name: t(q('div.nameCls')),
+        brand: t(q('div.brand strong')),
+        price: t(q('span.price strong')),
+        original_price: t(q('span.original-price')),
+        discount: t(q('span.discount')),
+        rating: '',
+        reviews: '',
+        image: a(q('img.rilrtl-lazy-img'), 'src') || a(q('img.rilrtl-lazy-img'), 'data-src')
+    };
+})"""
+
+async def scrape_keyword(page_pool, semaphore, seen_ids, img_queue, category, gender, keyword):
+    """Scrape one keyword search page; returns (products, failed_count).
+
+    Pages are borrowed from a shared pool on one browser context, so
+    navigations reuse the context's cookies, HTTP cache and connections
+    instead of paying page (or worse, browser) startup per keyword.
+    """
+    async with semaphore:
+        page = await page_pool.get()
+        products = []
+        failed_extractions = 0
+        try:
+            search_url = f"https://www.ajio.com/search/{keyword}"
+            console.print(f"[bold yellow]Scraping:[/bold yellow] {search_url}")
+
+            try:
+                await page.goto(search_url, timeout=60000, wait_until="domcontentloaded")
+                await page.wait_for_selector("div.rilrtl-products-list__item", timeout=30000)
+            except:
+                console.print(f"[red]Failed to load {search_url}[/red]")
+                return products, failed_extractions
+
+            # Infinite scroll: wait for the tile count to actually grow
+            # instead of sleeping a fixed pause every iteration
+            stable_cycles, tries = 0, 0
+            while tries < MAX_SCROLL_TRIES and stable_cycles < NO_GROWTH_CYCLES:
+                prev_count = await page.evaluate(ITEM_COUNT_JS)
+                await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
+                try:
+                    await page.wait_for_function(
+                        f"prev => {ITEM_COUNT_JS} > prev",
+                        arg=prev_count, timeout=3000
+                    )
+                except PlaywrightTimeoutError:
+                    stable_cycles += 1
+                else:
+                    stable_cycles = 0
+                tries += 1
+
+            # Extract products in a single round-trip
+            rows = await page.evaluate(EXTRACT_ITEMS_JS)
+            for el_data in rows:
+                # skeleton tiles hydrate with no name; skip before building
+                # the full dict and running the clean-up regexes on it
+                if not (el_data.get("name") or "").strip():
+                    failed_extractions += 1
+                    continue
+                pdata = parse_product(el_data, category, gender)
+
+                if pdata["product_id"]:
+                    if pdata["product_id"] in seen_ids:
+                        continue
+                    seen_ids.add(pdata["product_id"])
+
+                if DOWNLOAD_IMAGES and pdata.get("image_url"):
+                    folder_path, img_name, relative_path = generate_image_names(
+                        pdata["product_name"], pdata["brand"], category, gender
+                    )
+                    img_queue.put_nowait((pdata["image_url"], folder_path, img_name, relative_path, pdata))
+
+                products.append(pdata)
+
+            console.print(f"[bold blue]{keyword}: {len(products)} products[/bold blue]")
+            return products, failed_extractions
+        finally:
+            try:
+                await page.goto("about:blank")
+            except:
+                pass
+            await page_pool.put(page)
+
+async def scrape_ajio():
+    cols = {field: [] for field in FIELDS}
     failed_extractions = 0
-    category_counter = Counter()
-    brand_counter = Counter()
-    image_count = 0
     start_time = datetime.now()
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=HEADLESS)
-        page = browser.new_page(
-            user_agent=random.choice([
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 Version/15.0 Safari/605.1.15",
-                "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/118.0"
-            ])
+    # pre-create every (category, gender) image folder in one pass
+    for category, gender_map in keywords_map.items():
+        for gender in gender_map:
+            _ensure_dir(os.path.join(IMAGES_DIR, category, gender))
+
+    keyword_tasks = [
+        (category, gender, keyword)
+        for category, gender_map in keywords_map.items()
+        for gender, keywords in gender_map.items()
+        for keyword in keywords
+    ]
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    seen_ids = set()  # shared across all keywords in this run
+    results = []
+    browser_fallback = []
+
+    # Hit the JSON search API first; Chromium only for keywords it rejects
+    async with make_session() as session:
+        # image downloads drain in the background while scraping continues
+        img_queue = asyncio.Queue()
+        img_stats = {"images": 0}
+        workers = [
+            asyncio.create_task(img_worker(session, img_queue, img_stats))
+            for _ in range(IMAGE_WORKERS)
+        ]
+
+        api_results = await asyncio.gather(
+            *[fetch_keyword_api(session, semaphore, seen_ids, img_queue, c, g, k) for c, g, k in keyword_tasks],
+            return_exceptions=True
         )
+        for task, result in zip(keyword_tasks, api_results):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]API fetch failed for {task[2]} ({result}); falling back to browser[/yellow]")
+                browser_fallback.append(task)
+            else:
+                results.append(result)
+
+        if browser_fallback:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=HEADLESS)
+                context = await browser.new_context(
+                    user_agent=random.choice(USER_AGENTS),
+                    viewport={"width": 1366, "height": 768}
+                )
+                await context.route("**/*", block_heavy_requests)
+
+                page_pool = asyncio.Queue()
+                for _ in range(min(CONCURRENCY, len(browser_fallback))):
+                    await page_pool.put(await context.new_page())
 
-        for category, gender_map in keywords_map.items():
-            for gender, keywords in gender_map.items():
-                for keyword in keywords:
-                    search_url = f"https://www.ajio.com/search/{keyword}"
-                    console.print(f"[bold yellow]Scraping:[/bold yellow] {search_url}")
-
-                    try:
-                        page.goto(search_url, timeout=60000)
-                        page.wait_for_selector("div.rilrtl-products-list__item", timeout=30000)
-                    except:
-                        console.print(f"[red]Failed to load {search_url}[/red]")
+                browser_results = await asyncio.gather(
+                    *[scrape_keyword(page_pool, semaphore, seen_ids, img_queue, c, g, k) for c, g, k in browser_fallback],
+                    return_exceptions=True
+                )
+                for result in browser_results:
+                    if isinstance(result, Exception):
+                        console.print(f"[red]Keyword task failed: {result}[/red]")
                         continue
+                    results.append(result)
 
-                    # Infinite scroll
-                    prev_count, stable_cycles, tries = 0, 0, 0
-                    with Progress(SpinnerColumn(), TextColumn("[green]Scrolling[/green]"),
-                                  BarColumn(), TimeElapsedColumn()) as progress:
-                        task = progress.add_task("Scroll", total=MAX_SCROLL_TRIES)
-                        while tries < MAX_SCROLL_TRIES and stable_cycles < NO_GROWTH_CYCLES:
-                            page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-                            time.sleep(SCROLL_PAUSE_TIME + random.random())
-                            items = page.query_selector_all("div.rilrtl-products-list__item")
-                            curr_count = len(items)
-                            if curr_count == prev_count:
-                                stable_cycles += 1
-                            else:
-                                stable_cycles = 0
-                            prev_count = curr_count
-                            tries += 1
-                            progress.update(task, advance=1)
-
-                    # Extract products
-                    items = page.query_selector_all("div.rilrtl-products-list__item")
-                    for item in items:
-                        el_data = {
-                            "href": item.query_selector("a.rilrtl-products-list__link.desktop").get_attribute("href") if item.query_selector("a.rilrtl-products-list__link.desktop") else "",
-                            "name": item.query_selector("div.nameCls").inner_text() if item.query_selector("div.nameCls") else "",
-                            "brand": item.query_selector("div.brand strong").inner_text() if item.query_selector("div.brand strong") else "",
-                            "price": item.query_selector("span.price strong").inner_text() if item.query_selector("span.price strong") else "",
-                            "original_price": item.query_selector("span.original-price").inner_text() if item.query_selector("span.original-price") else "",
-                            "discount": item.query_selector("span.discount").inner_text() if item.query_selector("span.discount") else "",
-                            "rating": "",
-                            "reviews": "",
-                            "image": item.query_selector("img.rilrtl-lazy-img").get_attribute("src") if item.query_selector("img.rilrtl-lazy-img") else ""
-                        }
-
-                        pdata = parse_product(el_data, category, gender)
-                        if not pdata["product_name"]:
-                            failed_extractions += 1
-                            continue
-
-                        if DOWNLOAD_IMAGES and pdata.get("image_url"):
-                            folder_path, img_name, relative_path = generate_image_names(
-                                pdata["product_name"], pdata["brand"], category, gender
-                            )
-                            local_path = download_image(page, pdata["image_url"], folder_path, img_name)
-                            if local_path:
-                                image_count += 1
-                                pdata["image_path"] = relative_path
-
-                        all_products.append(pdata)
-                        category_counter[pdata["category"]] += 1
-                        brand_counter[pdata["brand"]] += 1
-
-        browser.close()
-
-    # Save outputs
-    df = pd.DataFrame(all_products)
-    df.to_csv(CSV_FILENAME, index=False)
-    with open(JSON_FILENAME, "w", encoding="utf-8") as f:
-        json.dump(all_products, f, ensure_ascii=False, indent=2)
+                await browser.close()
+
+        # let the download backlog finish before the session closes
+        await img_queue.join()
+        for worker in workers:
+            worker.cancel()
+        image_count = img_stats["images"]
+
+    for products, failed in results:
+        failed_extractions += failed
+        for pdata in products:
+            for field in FIELDS:
+                cols[field].append(pdata[field])
+
+    # Save outputs; prices and tiers are computed column-wise in one pass
+    df = pd.DataFrame(cols)
+    if not df.empty:
+        for col in ("price", "original_price"):
+            df[col] = pd.to_numeric(
+                df[col].astype(str).str.replace(_NONDIGIT, '', regex=True),
+                errors="coerce"
+            ).astype("float32")
+        df["price_tier"] = pd.cut(
+            df["price"],
+            bins=[-1, 2999.99, 7999.99, float("inf")],
+            labels=["affordable", "mid", "expensive"]
+        ).astype("object").fillna("unknown")
+        # low-cardinality columns dictionary-encode well in Parquet
+        for col in ("category", "gender", "price_tier", "source_platform", "brand"):
+            df[col] = df[col].astype("category")
+    df.to_parquet(PARQUET_FILENAME, engine="pyarrow", compression="zstd")
+    # CSV kept for quick eyeballing; pyarrow's writer is multi-threaded
+    pa.csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), CSV_FILENAME)
 
     # Final summary
     end_time = datetime.now()
-    total_products = len(all_products)
+    total_products = len(df)
     success_rate = round(total_products / (total_products + failed_extractions) * 100, 2) if total_products > 0 else 0
     total_time = end_time - start_time
     products_per_minute = round(total_products / (total_time.total_seconds()/60), 2) if total_time.total_seconds() > 0 else 0
@@ -230,9 +462,18 @@ def scrape_ajio():
     console.print(f"Total Time: {total_time}")
     console.print(f"Products/Minute: {products_per_minute}")
     console.print(f"Images Downloaded: {image_count}")
+    console.print(f"Parquet Saved: {PARQUET_FILENAME}")
     console.print(f"CSV Saved: {CSV_FILENAME}")
-    console.print(f"JSON Saved: {JSON_FILENAME}")
+
+    # aggregate over the finished columns in one vectorized pass each
+    if not df.empty:
+        console.print("\n[bold green]Products by Category:[/bold green]")
+        for cat, count in df["category"].value_counts().items():
+            console.print(f"{cat}: {count}")
+        console.print("\n[bold green]Top Brands:[/bold green]")
+        for brand, count in df["brand"].value_counts().head(10).items():
+            console.print(f"{brand}: {count}")
 
 
 if __name__ == "__main__":
-    scrape_ajio()
+    asyncio.run(scrape_ajio())
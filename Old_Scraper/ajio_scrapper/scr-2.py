@@ -1,16 +1,16 @@
 import os
+import csv
 import time
 import re
-import json
-import random
+import orjson
 import requests
 import shutil
+import asyncio
+from requests.adapters import HTTPAdapter, Retry
 from datetime import datetime
-import pandas as pd
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from collections import Counter
 
 # ---------------- CONFIG ----------------
@@ -21,11 +21,11 @@ TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
 OUTPUT_DIR = os.path.join(os.getcwd(), f"{OUT_PREFIX}_scrape_{TIMESTAMP}")
 IMAGES_DIR = os.path.join(OUTPUT_DIR, "images")
 CSV_FILENAME = os.path.join(OUTPUT_DIR, f"{OUT_PREFIX}_products_{TIMESTAMP}.csv")
-JSON_FILENAME = os.path.join(OUTPUT_DIR, f"{OUT_PREFIX}_products_{TIMESTAMP}.json")
+JSONL_FILENAME = os.path.join(OUTPUT_DIR, f"{OUT_PREFIX}_products_{TIMESTAMP}.jsonl")
 
-SCROLL_PAUSE_TIME = 1.5
 MAX_SCROLL_TRIES = 80
 NO_GROWTH_CYCLES = 5
+CONCURRENCY = 20  # max keyword pages loading at once
 DOWNLOAD_IMAGES = True  # set True to download all images
 
 console = Console()
@@ -50,28 +50,49 @@ CATEGORIES = {
 }
 
 # ---------------- UTILITIES ----------------
+# Compiled once; these run on several fields of every product
+_WS = re.compile(r'\s+')
+_NONDIGIT = re.compile(r'[^\d.]')
+_NONALNUM = re.compile(r'[^a-zA-Z0-9]+')
+
+_created_dirs = set()
+
+def _ensure_dir(path):
+    """mkdir once per folder; only a handful of (category, gender) dirs exist."""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
 def clean_text(text):
-    return re.sub(r'\s+', ' ', text.strip()) if text else ""
+    return _WS.sub(' ', text.strip()) if text else ""
 
 def extract_price(price_text):
     if not price_text:
         return None
-    cleaned = re.sub(r'[^\d.]', '', price_text.replace(',', ''))
+    cleaned = _NONDIGIT.sub('', price_text.replace(',', ''))
     try:
         return float(cleaned) if cleaned else None
     except:
         return None
 
+# One session for all image downloads so urllib3 pools connections to the
+# CDN instead of paying a TCP+TLS handshake per image
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+
 def download_image(image_url, folder_path, filename):
-    if not image_url: 
+    if not image_url:
         return None
-    os.makedirs(folder_path, exist_ok=True)
+    _ensure_dir(folder_path)
     local_path = os.path.join(folder_path, filename)
-    if os.path.exists(local_path): 
+    if os.path.exists(local_path):
         return local_path
-    headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        resp = requests.get(image_url, headers=headers, stream=True, timeout=20)
+        resp = _SESSION.get(image_url, stream=True, timeout=20)
         if resp.status_code == 200:
             with open(local_path, 'wb') as f:
                 shutil.copyfileobj(resp.raw, f)
@@ -80,6 +101,13 @@ def download_image(image_url, folder_path, filename):
         return None
     return None
 
+# Output schema; rows stream straight to CSV/JSONL as keywords finish
+FIELDNAMES = (
+    "product_id", "category", "gender", "product_url", "product_name",
+    "brand", "price", "original_price", "discount_percent", "rating",
+    "reviews", "price_tier", "image_url", "image_unique_name", "source_platform"
+)
+
 def parse_product(el, category="Shoes", gender="Women"):
     pdata = {
         "product_id": "",
@@ -117,8 +145,8 @@ def parse_product(el, category="Shoes", gender="Women"):
         pdata["image_url"] = img if img and img.startswith("http") else ""
 
         if pdata["product_id"]:
-            base_name = re.sub(r'[^a-zA-Z0-9]+', '-', pdata["product_name"].lower())[:50]
-            brand_name = re.sub(r'[^a-zA-Z0-9]+', '-', pdata["brand"].lower())[:20]
+            base_name = _NONALNUM.sub('-', pdata["product_name"].lower())[:50]
+            brand_name = _NONALNUM.sub('-', pdata["brand"].lower())[:20]
             pdata["image_unique_name"] = f"{pdata['product_id']}-{brand_name}-{base_name}.jpg"
 
         p = pdata["price"]
@@ -137,78 +165,148 @@ def parse_product(el, category="Shoes", gender="Women"):
     return pdata
 
 # ---------------- SCRAPER ----------------
-def scrape_ajio_keywords():
+ITEM_COUNT_JS = "document.querySelectorAll('div.rilrtl-products-list__item').length"
+
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+BLOCKED_DOMAINS = ("google-analytics", "googletagmanager", "doubleclick", "segment")
+
+async def block_heavy_requests(route):
+    """Abort image/font/media/tracker requests; extraction only needs the DOM.
+
+    Image URLs are still read from the tiles' src attributes and downloaded
+    separately over HTTP, so product images are unaffected.
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(d in request.url for d in BLOCKED_DOMAINS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Maps every tile in-page in a single CDP call; scoping the per-field
+# lookups under each tile keeps the fields aligned per product
+EXTRACT_ITEMS_JS = """els => els.map(it => {
+    const q = (s) => it.querySelector(s);
+    const t = (e) => e ? e.innerText : '';
+    const a = (e, x) => e ? e.getAttribute(x) : null;
+    const img = q('img.rilrtl-lazy-img');
+    return {
+        href: a(q('a.rilrtl-products-list__link.desktop'), 'href') || '',
+        name: t(q('div.nameCls')),
+        brand: t(q('div.brand strong')),
+        price: t(q('span.price strong')) || null,
+        original_price: t(q('span.orginal-price')) || null,
+        discount: t(q('span.discount')),
+        rating: t(q('p._3I65V')),
+        reviews: t(q("div._2mae- p[aria-label*='reviews']")),
+        image: a(img, 'src'),
+        image_fallback: a(img, 'data-src')
+    };
+})"""
+
+async def scrape_keyword(context, semaphore, seen_ids, writer, jsonl_f, category, gender, keyword):
+    """Scrape a single keyword search page and return its products."""
+    async with semaphore:
+        page = await context.new_page()
+        products = []
+        try:
+            search_url = f"https://www.ajio.com/s/{keyword}?query=:relevance"
+            console.print(Panel(f"[bold green]Scraping keyword:[/bold green] {keyword}"))
+            await page.goto(search_url, timeout=60000, wait_until="domcontentloaded")
+            await page.wait_for_selector("div.rilrtl-products-list__item", timeout=30000)
+
+            # Infinite scroll: wait for the tile count to actually grow
+            # instead of sleeping a fixed pause every iteration
+            stable_cycles, tries = 0, 0
+            while tries < MAX_SCROLL_TRIES and stable_cycles < NO_GROWTH_CYCLES:
+                prev_count = await page.evaluate(ITEM_COUNT_JS)
+                await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
+                try:
+                    await page.wait_for_function(
+                        f"prev => {ITEM_COUNT_JS} > prev",
+                        arg=prev_count, timeout=3000
+                    )
+                except PlaywrightTimeoutError:
+                    stable_cycles += 1
+                else:
+                    stable_cycles = 0
+                tries += 1
+
+            # Extract data for all tiles in one round-trip
+            rows = await page.locator("div.rilrtl-products-list__item").evaluate_all(EXTRACT_ITEMS_JS)
+            for el_data in rows:
+                # skeleton tiles hydrate with no name; skip before any
+                # parsing or image work
+                if not (el_data.get("name") or "").strip():
+                    continue
+
+                pdata = parse_product(el_data, category, gender)
+
+                # related keywords return heavily overlapping tiles; skip
+                # repeats before any image work happens
+                if pdata["product_id"]:
+                    if pdata["product_id"] in seen_ids:
+                        continue
+                    seen_ids.add(pdata["product_id"])
+
+                if DOWNLOAD_IMAGES and pdata["image_url"]:
+                    # download_image blocks on requests; run it in a
+                    # worker thread so the other keyword tasks keep going
+                    folder_path = os.path.join(IMAGES_DIR, category, gender)
+                    await asyncio.to_thread(
+                        download_image, pdata["image_url"], folder_path, pdata["image_unique_name"]
+                    )
+
+                products.append(pdata)
+
+            # stream this keyword's rows out immediately; a crash later
+            # still leaves everything scraped so far on disk
+            writer.writerows(products)
+            jsonl_f.writelines(
+                orjson.dumps(pdata, option=orjson.OPT_APPEND_NEWLINE) for pdata in products
+            )
+            return products
+        finally:
+            await page.close()
+
+async def scrape_ajio_keywords():
     all_products = []
     start_time = time.time()
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        page = browser.new_page()
-
-        for category, genders in CATEGORIES.items():
-            for gender, keywords in genders.items():
-                for keyword in keywords:
-                    search_url = f"https://www.ajio.com/s/{keyword}?query=:relevance"
-                    console.print(Panel(f"[bold green]Scraping keyword:[/bold green] {keyword}"))
-                    page.goto(search_url, timeout=60000)
-                    page.wait_for_selector("div.rilrtl-products-list__item", timeout=30000)
-
-                    # Infinite scroll
-                    prev_count, stable_cycles, tries = 0, 0, 0
-                    while tries < MAX_SCROLL_TRIES and stable_cycles < NO_GROWTH_CYCLES:
-                        page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-                        time.sleep(SCROLL_PAUSE_TIME + random.random())
-                        items = page.query_selector_all("div.rilrtl-products-list__item")
-                        curr_count = len(items)
-                        if curr_count == prev_count:
-                            stable_cycles += 1
-                        else:
-                            stable_cycles = 0
-                        prev_count = curr_count
-                        tries += 1
-
-                    # Extract data
-                    for item in page.query_selector_all("div.rilrtl-products-list__item"):
-                        el_data = {}
-                        try: el_data["href"] = item.query_selector("a.rilrtl-products-list__link.desktop").get_attribute("href")
-                        except: el_data["href"] = ""
-                        try: el_data["name"] = item.query_selector("div.nameCls").inner_text()
-                        except: el_data["name"] = ""
-                        try: el_data["brand"] = item.query_selector("div.brand strong").inner_text()
-                        except: el_data["brand"] = ""
-                        try: el_data["price"] = item.query_selector("span.price strong").inner_text()
-                        except: el_data["price"] = None
-                        try: el_data["original_price"] = item.query_selector("span.orginal-price").inner_text()
-                        except: el_data["original_price"] = None
-                        try: el_data["discount"] = item.query_selector("span.discount").inner_text()
-                        except: el_data["discount"] = ""
-                        try: el_data["rating"] = item.query_selector("p._3I65V").inner_text()
-                        except: el_data["rating"] = ""
-                        try: el_data["reviews"] = item.query_selector("div._2mae- p[aria-label*='reviews']").inner_text()
-                        except: el_data["reviews"] = ""
-                        try:
-                            img_el = item.query_selector("img.rilrtl-lazy-img")
-                            el_data["image"] = img_el.get_attribute("src") if img_el else None
-                            if not el_data["image"]:
-                                el_data["image_fallback"] = img_el.get_attribute("data-src") if img_el else None
-                        except:
-                            el_data["image"] = None
-
-                        pdata = parse_product(el_data, category, gender)
-
-                        if DOWNLOAD_IMAGES and pdata["image_url"]:
-                            folder_path = os.path.join(IMAGES_DIR, category, gender)
-                            _ = download_image(pdata["image_url"], folder_path, pdata["image_unique_name"])
-
-                        all_products.append(pdata)
-
-        browser.close()
-
-    # Save outputs
-    df = pd.DataFrame(all_products)
-    df.to_csv(CSV_FILENAME, index=False)
-    with open(JSON_FILENAME, "w", encoding="utf-8") as f:
-        json.dump(all_products, f, ensure_ascii=False, indent=2)
+    # pre-create every (category, gender) image folder in one pass
+    for category, genders in CATEGORIES.items():
+        for gender in genders:
+            _ensure_dir(os.path.join(IMAGES_DIR, category, gender))
+
+    csv_f = open(CSV_FILENAME, "w", newline="", encoding="utf-8")
+    writer = csv.DictWriter(csv_f, fieldnames=FIELDNAMES)
+    writer.writeheader()
+    jsonl_f = open(JSONL_FILENAME, "wb")
+
+    try:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=False)
+            context = await browser.new_context()
+            await context.route("**/*", block_heavy_requests)
+            semaphore = asyncio.Semaphore(CONCURRENCY)
+            seen_ids = set()  # shared across all keywords in this run
+
+            tasks = [
+                scrape_keyword(context, semaphore, seen_ids, writer, jsonl_f, category, gender, keyword)
+                for category, genders in CATEGORIES.items()
+                for gender, keywords in genders.items()
+                for keyword in keywords
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    console.print(f"[red]Keyword task failed: {result}[/red]")
+                    continue
+                all_products.extend(result)
+
+            await browser.close()
+    finally:
+        csv_f.close()
+        jsonl_f.close()
 
     elapsed = time.time() - start_time
     products_count = len(all_products)
@@ -223,10 +321,10 @@ def scrape_ajio_keywords():
     console.print(f"Total Time: {time.strftime('%H:%M:%S', time.gmtime(elapsed))}")
     console.print(f"Products/Minute: {products_per_min}")
     console.print(f"CSV File: {CSV_FILENAME}")
-    console.print(f"JSON File: {JSON_FILENAME}")
+    console.print(f"JSONL File: {JSONL_FILENAME}")
     console.print("\n[bold green]Top Brands:[/bold green]")
     for b, c in top_brands:
         console.print(f"{b}: {c}")
 
 if __name__ == "__main__":
-    scrape_ajio_keywords()
+    asyncio.run(scrape_ajio_keywords())
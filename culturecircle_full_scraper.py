@@ -1,21 +1,37 @@
 import os
+import csv
 import time
 import re
 import json
+import queue
 import random
-import shutil
 import logging
+import asyncio
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # image downloads fall back to requests
+try:
+    import orjson
+except ImportError:
+    orjson = None  # JSON output falls back to the stdlib encoder
+try:
+    import lxml.html
+except ImportError:
+    lxml = None  # page_source fallback parsing unavailable
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+from rich.progress import Progress
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -35,12 +51,20 @@ OUTPUT_DIR = os.path.join(os.getcwd(), f"{OUT_PREFIX}_scrape_{TIMESTAMP}")
 IMAGES_DIR = os.path.join(OUTPUT_DIR, "images")
 CSV_FILENAME = os.path.join(OUTPUT_DIR, f"{OUT_PREFIX}_products_{TIMESTAMP}.csv")
 JSON_FILENAME = os.path.join(OUTPUT_DIR, f"{OUT_PREFIX}_products_{TIMESTAMP}.json")
+# rows land here first, one object per line; converted to JSON_FILENAME
+# at the end so a crash mid-run still leaves valid, parseable output
+JSONL_FILENAME = os.path.join(OUTPUT_DIR, f"{OUT_PREFIX}_products_{TIMESTAMP}.jsonl")
 
-SCROLL_PAUSE_TIME = 1.5
+SCROLL_POLL_INTERVAL = 0.1   # how often to check whether the page grew
+SCROLL_DEADLINE = 2.5        # max wait per scroll before assuming no growth
 MAX_SCROLL_TRIES = 200
 NO_GROWTH_CYCLES = 5
 DOWNLOAD_IMAGES = True
 
+WORKER_COUNT = 6        # concurrent Selenium drivers; scraping is IO-bound
+IMAGE_WORKER_COUNT = 8  # requests fallback threads draining the image queue
+IMAGE_BATCH_SIZE = 100  # images fetched concurrently per aiohttp batch
+
 LOGS_DIR = os.path.join(os.getcwd(), "logs")
 os.makedirs(LOGS_DIR, exist_ok=True)
 console = Console()
@@ -73,6 +97,26 @@ def _user_agents():
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0"
     ]
 
+# Extraction only reads the DOM (text + src attributes), so images,
+# webfonts and stylesheets are wasted bandwidth on every scroll step.
+# Product images still get downloaded separately from their src URLs.
+_IMAGE_BLOCK_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+}
+_BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.css",
+]
+
+def _block_heavy_resources(driver):
+    """Block image/font/stylesheet fetches over CDP; best effort."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+    except WebDriverException as e:
+        logger.warning(f"Could not block heavy resources: {e}")
+
 def create_driver(headless=True, timeout=20):
     try:
         if EDGE_DRIVER_PATH and os.path.exists(EDGE_DRIVER_PATH):
@@ -84,12 +128,14 @@ def create_driver(headless=True, timeout=20):
             service = EdgeService(EDGE_DRIVER_PATH)
             driver = webdriver.Edge(service=service, options=opts)
             driver.set_page_load_timeout(timeout)
+            _block_heavy_resources(driver)
             return driver
         elif CHROME_DRIVER_PATH and os.path.exists(CHROME_DRIVER_PATH):
             opts = ChromeOptions()
             if headless:
                 opts.add_argument("--headless=new")
             opts.add_argument(f"--user-agent={random.choice(_user_agents())}")
+            opts.add_experimental_option("prefs", _IMAGE_BLOCK_PREFS)
             service = ChromeService(CHROME_DRIVER_PATH)
             driver = webdriver.Chrome(service=service, options=opts)
             driver.set_page_load_timeout(timeout)
@@ -99,6 +145,7 @@ def create_driver(headless=True, timeout=20):
             if headless:
                 opts.add_argument("--headless=new")
             opts.add_argument(f"--user-agent={random.choice(_user_agents())}")
+            opts.add_experimental_option("prefs", _IMAGE_BLOCK_PREFS)
             driver = webdriver.Chrome(options=opts)
             driver.set_page_load_timeout(timeout)
             return driver
@@ -107,41 +154,100 @@ def create_driver(headless=True, timeout=20):
         raise
 
 # ---------------- UTILITIES ----------------
+# Compiled once at import; these run on several fields of every product
+_WS_RE = re.compile(r'\s+')
+_NONDIGIT_RE = re.compile(r'[^\d.]')
+_NONALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
 def clean_text(text: Optional[str]) -> str:
-    return re.sub(r'\s+', ' ', text.strip()) if text else ""
+    return _WS_RE.sub(' ', text.strip()) if text else ""
 
 def extract_price(price_text: str) -> Optional[float]:
     if not price_text:
         return None
-    cleaned = re.sub(r'[^\d.]', '', price_text.replace(',', ''))
+    cleaned = _NONDIGIT_RE.sub('', price_text.replace(',', ''))
     try:
         return float(cleaned) if cleaned else None
-    except:
+    except (ValueError, TypeError):
         return None
 
+@lru_cache(maxsize=8192)
+def _sanitize(text: str, maxlen: int) -> str:
+    """Slug a name for use in a filename; cached since brands and many
+    product names repeat across keyword searches."""
+    cleaned = _NONALNUM_RE.sub('', text.lower())
+    return _WS_RE.sub('-', cleaned)[:maxlen]
+
 def generate_image_names(product_name: str, brand: str, category: str, gender: str):
-    clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', (product_name or "").lower())
-    clean_name = re.sub(r'\s+', '-', clean_name)[:60]
-    clean_brand = re.sub(r'[^a-zA-Z0-9\s]', '', (brand or "nobrand").lower())
-    clean_brand = re.sub(r'\s+', '-', clean_brand)[:30]
+    clean_name = _sanitize(product_name or "", 60)
+    clean_brand = _sanitize(brand or "nobrand", 30)
     folder_path = os.path.join(IMAGES_DIR, category, gender)
     image_name = f"{clean_name}-{clean_brand}.jpg"
     return folder_path, image_name
 
+# Shared session so urllib3 keeps connections to the image CDN open
+# instead of paying a TCP+TLS handshake per image. requests.Session is
+# safe to share across the worker threads for plain GETs.
+_IMAGE_SESSION = requests.Session()
+_IMAGE_SESSION.headers.update({"User-Agent": random.choice(_user_agents())})
+_IMAGE_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32, pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.5)
+))
+
+# The same CDN URL shows up under several keyword searches; remember
+# where it landed so repeats skip the HTTP fetch entirely. The map is
+# persisted to a manifest so later runs inherit it — output dirs are
+# timestamped, so the manifest lives next to the script instead.
+MANIFEST_FILENAME = os.path.join(os.getcwd(), "images_manifest.jsonl")
+
+_DOWNLOADED_URLS = {}
+_manifest_lock = threading.Lock()
+
+def _load_manifest():
+    try:
+        with open(MANIFEST_FILENAME, "rb") as f:
+            for line in f:
+                try:
+                    d = json.loads(line)
+                    _DOWNLOADED_URLS[d["u"]] = d["p"]
+                except (ValueError, KeyError):
+                    continue  # half-written line from a crashed run
+    except FileNotFoundError:
+        pass
+    return open(MANIFEST_FILENAME, "ab")
+
+_manifest_f = _load_manifest()
+
+def _record_download(image_url, local_path):
+    _DOWNLOADED_URLS[image_url] = local_path
+    with _manifest_lock:
+        _manifest_f.write(_dump_row({"u": image_url, "p": local_path}) + b'\n')
+        _manifest_f.flush()
+
+def _cached_image(image_url):
+    """Path from an earlier download of this URL, if it still exists."""
+    cached = _DOWNLOADED_URLS.get(image_url)
+    if cached and os.path.exists(cached):
+        return cached
+    return None
+
 def download_image(image_url: str, folder_path: str, filename: str, max_attempts=2):
     if not image_url: return None
-    os.makedirs(folder_path, exist_ok=True)
+    cached = _cached_image(image_url)
+    if cached:
+        return cached
     local_path = os.path.join(folder_path, filename)
     if os.path.exists(local_path): return local_path
-    headers = {"User-Agent": random.choice(_user_agents())}
     attempt = 0
     while attempt < max_attempts:
         try:
-            resp = requests.get(image_url, headers=headers, stream=True, timeout=12)
+            resp = _IMAGE_SESSION.get(image_url, stream=True, timeout=12)
             if resp.status_code == 200:
                 with open(local_path, 'wb') as f:
-                    resp.raw.decode_content = True
-                    shutil.copyfileobj(resp.raw, f)
+                    for chunk in resp.iter_content(65536):
+                        f.write(chunk)
+                _record_download(image_url, local_path)
                 return local_path
             else:
                 attempt += 1
@@ -154,33 +260,72 @@ def download_image(image_url: str, folder_path: str, filename: str, max_attempts
 
 # ---------------- SCROLL ----------------
 def infinite_scroll_load_all(driver, item_selector):
+    # progress goes to the log only; a per-scroll Rich bar cannot be
+    # shared across concurrent worker threads
     prev_count = 0
     stable_cycles = 0
     tries = 0
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold green]Scrolling...[/bold green]"),
-        BarColumn(),
-        TimeElapsedColumn(),
-    ) as progress:
-        task = progress.add_task("Scroll", total=MAX_SCROLL_TRIES)
-        while tries < MAX_SCROLL_TRIES and stable_cycles < NO_GROWTH_CYCLES:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(SCROLL_PAUSE_TIME + random.random()*0.8)
-            items = driver.find_elements(By.CSS_SELECTOR, item_selector)
-            curr_count = len(items)
-            logger.info(f"Scroll {tries+1}: {curr_count} items")
-            if curr_count == prev_count:
-                stable_cycles += 1
-            else:
-                stable_cycles = 0
-            prev_count = curr_count
-            tries += 1
-            progress.update(task, advance=1)
-        return driver.find_elements(By.CSS_SELECTOR, item_selector)
+    while tries < MAX_SCROLL_TRIES and stable_cycles < NO_GROWTH_CYCLES:
+        prev_height = driver.execute_script("return document.body.scrollHeight")
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        # poll for the page to actually grow instead of sleeping a fixed
+        # pause; most scrolls load new cards well before the deadline
+        deadline = time.time() + SCROLL_DEADLINE
+        while time.time() < deadline:
+            if driver.execute_script("return document.body.scrollHeight") > prev_height:
+                break
+            time.sleep(SCROLL_POLL_INTERVAL)
+        # counting in-page avoids materializing a WebElement per card on
+        # every iteration just to take len()
+        curr_count = driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length", item_selector
+        )
+        logger.info(f"Scroll {tries+1}: {curr_count} items")
+        if curr_count == prev_count:
+            stable_cycles += 1
+        else:
+            stable_cycles = 0
+        prev_count = curr_count
+        tries += 1
+    return prev_count
 
 # ---------------- PARSE PRODUCT ----------------
-def parse_culture_item(element, category, gender):
+# Walks every product card inside the page and returns raw fields in one
+# webdriver call, instead of 3-6 JSON-over-HTTP round-trips per card
+EXTRACT_ITEMS_JS = """
+const cards = document.querySelectorAll('a.flex.flex-col.gap-3.w-full');
+const result = [];
+for (const card of cards) {
+    const img = card.querySelector('img');
+    const spans = card.querySelectorAll('div.flex.items-baseline.gap-1 span');
+    const prices = [];
+    for (const sp of spans) {
+        prices.push({cls: sp.className || '', txt: sp.textContent || ''});
+    }
+    result.push({
+        url: card.getAttribute('href') || '',
+        name: img ? (img.getAttribute('alt') || '') : '',
+        image: img ? (img.getAttribute('src') || '') : '',
+        prices: prices
+    });
+}
+return result;
+"""
+
+# Output schema; rows stream straight to CSV/JSON as keywords finish
+FIELDNAMES = (
+    "category", "gender", "product_url", "product_name", "brand",
+    "price", "discounted_price", "price_tier", "combined_tier",
+    "image_url", "source_platform"
+)
+
+def _dump_row(pdata) -> bytes:
+    """Serialize one product row; orjson's C encoder when available."""
+    if orjson is not None:
+        return orjson.dumps(pdata)
+    return json.dumps(pdata, ensure_ascii=False, separators=(',', ':')).encode("utf-8")
+
+def parse_culture_dict(item, category, gender):
     pdata = {
         "category": category,
         "gender": gender,
@@ -195,49 +340,45 @@ def parse_culture_item(element, category, gender):
         "source_platform": SOURCE_PLATFORM
     }
     try:
-        href = element.get_attribute("href") or ""
+        href = item.get("url") or ""
         pdata["product_url"] = BASE_URL + href if href.startswith("/") else href
-        try:
-            img = element.find_element(By.TAG_NAME, "img")
-            pdata["image_url"] = img.get_attribute("src") or ""
-            pdata["product_name"] = clean_text(img.get_attribute("alt") or "")
-            if not pdata["brand"] and pdata["product_name"]:
-                pdata["brand"] = pdata["product_name"].split()[0]
-        except: pass
-
-        # Extract prices using robust method
-        try:
-            spans = element.find_elements(By.CSS_SELECTOR, "div.flex.items-baseline.gap-1 span")
-            for sp in spans:
-                cls = sp.get_attribute("class") or ""
-                txt = sp.text.replace(",", "").strip()
-                if not txt: continue
-                price_val = extract_price(txt)
-                if "line-through" in cls:
-                    pdata["price"] = price_val
-                else:
-                    pdata["discounted_price"] = price_val
-            if pdata["price"] is None:
-                pdata["price"] = pdata["discounted_price"]
-        except: pass
-
-        # Price tiers
-        try:
-            p = pdata.get("discounted_price") or pdata.get("price")
-            if p is None:
-                pdata["price_tier"] = "unknown"
-            elif p < 3000:
-                pdata["price_tier"] = "affordable"
-            elif p < 8000:
-                pdata["price_tier"] = "mid"
+        pdata["image_url"] = item.get("image") or ""
+        pdata["product_name"] = clean_text(item.get("name") or "")
+        if not pdata["brand"] and pdata["product_name"]:
+            pdata["brand"] = pdata["product_name"].split()[0]
+
+        # Extract prices; malformed entries are skipped, not swallowed
+        for sp in item.get("prices") or []:
+            try:
+                cls = sp.get("cls") or ""
+                txt = (sp.get("txt") or "").replace(",", "").strip()
+            except (AttributeError, TypeError) as e:
+                logger.debug(f"Skipping malformed price entry: {e}")
+                continue
+            if not txt: continue
+            price_val = extract_price(txt)
+            if "line-through" in cls:
+                pdata["price"] = price_val
             else:
-                pdata["price_tier"] = "expensive"
-            pdata["combined_tier"] = pdata["price_tier"]
-        except: pass
+                pdata["discounted_price"] = price_val
+        if pdata["price"] is None:
+            pdata["price"] = pdata["discounted_price"]
+
+        # Price tiers; extract_price only ever yields float or None
+        p = pdata.get("discounted_price") or pdata.get("price")
+        if p is None:
+            pdata["price_tier"] = "unknown"
+        elif p < 3000:
+            pdata["price_tier"] = "affordable"
+        elif p < 8000:
+            pdata["price_tier"] = "mid"
+        else:
+            pdata["price_tier"] = "expensive"
+        pdata["combined_tier"] = pdata["price_tier"]
 
         return pdata
-    except Exception as e:
-        logger.warning(f"parse_culture_item warning: {e}")
+    except (AttributeError, TypeError, ValueError) as e:
+        logger.warning(f"parse_culture_dict warning: {e}")
         return pdata
 
 # ---------------- FULL CATEGORIES & KEYWORDS ----------------
@@ -336,47 +477,315 @@ CATEGORIES = {
     }
 }
 
+# Flattened once at import; the worker queue and progress totals both
+# read from this instead of re-walking the nested dict
+_TASKS = [
+    (category, gender, keyword)
+    for category, genders in CATEGORIES.items()
+    for gender, keywords in genders.items()
+    for keyword in keywords
+]
+_TOTAL_TASKS = len(_TASKS)
+
+# ---------------- API-FIRST SCRAPE ----------------
+API_SEARCH_URL = BASE_URL + "/api/search"
+API_PAGE_LIMIT = 50  # safety cap on pagination
+
+_API_SESSION = requests.Session()
+_API_SESSION.headers.update({
+    "User-Agent": random.choice(_user_agents()),
+    "Accept": "application/json",
+})
+
+def _api_item_to_dict(item):
+    """Map one API product into the shape EXTRACT_ITEMS_JS produces."""
+    prices = []
+    original = item.get("original_price") or item.get("mrp")
+    if original is not None:
+        prices.append({"cls": "line-through", "txt": str(original)})
+    current = item.get("price") or item.get("selling_price")
+    if current is not None:
+        prices.append({"cls": "", "txt": str(current)})
+    return {
+        "url": item.get("url") or item.get("slug") or "",
+        "name": item.get("name") or item.get("title") or "",
+        "image": item.get("image") or item.get("image_url") or "",
+        "prices": prices,
+    }
+
+def try_api_scrape_keyword(keyword):
+    """Page through the search XHR endpoint directly, skipping the browser.
+
+    Returns raw item dicts, or None when the endpoint is unavailable or
+    answers with something other than product JSON — the Selenium path
+    takes over in that case.
+    """
+    items = []
+    try:
+        page_num = 1
+        while page_num <= API_PAGE_LIMIT:
+            resp = _API_SESSION.get(
+                API_SEARCH_URL, params={"q": keyword, "page": page_num}, timeout=12
+            )
+            if resp.status_code != 200 or "json" not in resp.headers.get("Content-Type", ""):
+                return None
+            payload = resp.json()
+            batch = payload.get("items") or payload.get("products") or []
+            if not batch:
+                # no recognizable product list on the first page means the
+                # guessed endpoint/shape is wrong, not a zero-result search;
+                # hand the keyword to the browser path instead
+                if page_num == 1:
+                    return None
+                break
+            items.extend(_api_item_to_dict(it) for it in batch)
+            page_num += 1
+    except (requests.RequestException, ValueError, AttributeError) as e:
+        logger.warning(f"API search failed for '{keyword}': {e}")
+        return None
+    return items
+
+def parse_page_source(html):
+    """Extract card dicts from raw page HTML with lxml.
+
+    Backstop for pages where the injected extractor returns nothing
+    (e.g. the script was blocked); one C-speed parse of page_source
+    replaces any per-element WebDriver traffic. Returns the same raw
+    shape as EXTRACT_ITEMS_JS.
+    """
+    tree = lxml.html.fromstring(html)
+    items = []
+    for card in tree.cssselect("a.flex.flex-col.gap-3.w-full"):
+        imgs = card.cssselect("img")
+        items.append({
+            "url": card.get("href") or "",
+            "name": (imgs[0].get("alt") or "") if imgs else "",
+            "image": (imgs[0].get("src") or "") if imgs else "",
+            "prices": [
+                {"cls": sp.get("class") or "", "txt": sp.text_content() or ""}
+                for sp in card.cssselect("div.flex.items-baseline.gap-1 span")
+            ],
+        })
+    return items
+
+# ---------------- WORKERS ----------------
+def scrape_worker(task_queue, writer, csv_f, jsonl_f, results_lock, summary, image_queue,
+                  progress, progress_task):
+    """Pull (category, gender, keyword) tasks until the queue runs dry.
+
+    Keywords are tried against the search API first; the browser only
+    starts (once per worker) for keywords the API cannot serve.
+    """
+    driver = None
+    try:
+        while True:
+            try:
+                category, gender, keyword = task_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                console.print(Panel(f"[bold green]Searching keyword:[/bold green] {keyword}"))
+                items = try_api_scrape_keyword(keyword)
+                if items is None:
+                    if driver is None:
+                        driver = create_driver(headless=True)
+                    driver.get(SEARCH_URL + keyword)
+                    time.sleep(2 + random.random()*1.5)
+                    infinite_scroll_load_all(driver, "a.flex.flex-col.gap-3.w-full")
+                    # one script call pulls every card's fields at once instead
+                    # of a webdriver round-trip per attribute per card
+                    items = driver.execute_script(EXTRACT_ITEMS_JS)
+                    if not items and lxml is not None:
+                        items = parse_page_source(driver.page_source)
+                console.print(f"[bold blue]Found {len(items)} products for '{keyword}'[/bold blue]")
+
+                rows = []
+                for item in items:
+                    pdata = parse_culture_dict(item, category, gender)
+                    rows.append(pdata)
+                    if DOWNLOAD_IMAGES and pdata.get("image_url"):
+                        folder_path, img_name = generate_image_names(
+                            pdata.get("product_name"), pdata.get("brand"), category, gender
+                        )
+                        image_queue.put((pdata["image_url"], folder_path, img_name))
+
+                # stream this keyword's rows straight to disk; only the
+                # per-keyword counts stay in memory. Flushing here means a
+                # crash loses at most the keyword in flight.
+                with results_lock:
+                    writer.writerows(rows)
+                    csv_f.flush()
+                    jsonl_f.writelines(_dump_row(pdata) + b'\n' for pdata in rows)
+                    jsonl_f.flush()
+                    summary[keyword] = len(rows)
+            except Exception as e:
+                logger.error(f"Worker failed on '{keyword}': {e}")
+            finally:
+                progress.advance(progress_task)
+                task_queue.task_done()
+    finally:
+        if driver is not None:
+            driver.quit()
+
+def image_worker(image_queue):
+    """Drain (url, folder, name) tuples so downloads never block scraping."""
+    while True:
+        item = image_queue.get()
+        try:
+            if item is None:
+                break
+            image_url, folder_path, img_name = item
+            download_image(image_url, folder_path, img_name)
+        finally:
+            image_queue.task_done()
+
+async def download_image_async(session, image_url, folder_path, filename):
+    try:
+        cached = _cached_image(image_url)
+        if cached:
+            return cached
+        local_path = os.path.join(folder_path, filename)
+        if os.path.exists(local_path):
+            return local_path
+        async with session.get(image_url) as resp:
+            if resp.status != 200:
+                return None
+            with open(local_path, "wb") as f:
+                async for chunk in resp.content.iter_chunked(65536):
+                    f.write(chunk)
+        _record_download(image_url, local_path)
+        return local_path
+    except Exception as e:
+        logger.warning(f"Async image download error {e}")
+        return None
+
+async def _bulk_download(batch):
+    connector = aiohttp.TCPConnector(limit=64)
+    timeout = aiohttp.ClientTimeout(total=12)
+    headers = {"User-Agent": random.choice(_user_agents())}
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+        await asyncio.gather(*[
+            download_image_async(session, url, folder, name) for url, folder, name in batch
+        ])
+
+def image_batch_worker(image_queue):
+    """Download queued images in concurrent aiohttp batches.
+
+    One thread collapses the queue into batches of up to IMAGE_BATCH_SIZE
+    and fetches each batch in parallel, so the download phase takes the
+    max of the batch's latencies instead of their sum.
+    """
+    done = False
+    while not done:
+        item = image_queue.get()
+        if item is None:
+            image_queue.task_done()
+            break
+        batch = [item]
+        got_sentinel = False
+        while len(batch) < IMAGE_BATCH_SIZE:
+            try:
+                nxt = image_queue.get_nowait()
+            except queue.Empty:
+                break
+            if nxt is None:
+                done = True
+                got_sentinel = True
+                break
+            batch.append(nxt)
+        try:
+            asyncio.run(_bulk_download(batch))
+        except Exception as e:
+            logger.error(f"Image batch failed: {e}")
+        finally:
+            for _ in batch:
+                image_queue.task_done()
+            if got_sentinel:
+                image_queue.task_done()
+
 # ---------------- MAIN ----------------
 def scrape_culture_circle():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     os.makedirs(IMAGES_DIR, exist_ok=True)
-    driver = create_driver(headless=True)
-    all_products = []
+    # every (category, gender) folder up front; the download paths can
+    # then assume their target directory exists
+    for category, genders in CATEGORIES.items():
+        for gender in genders:
+            os.makedirs(os.path.join(IMAGES_DIR, category, gender), exist_ok=True)
+    results_lock = threading.Lock()
     summary = {}
 
+    csv_f = open(CSV_FILENAME, "w", newline="", encoding="utf-8")
+    writer = csv.DictWriter(csv_f, fieldnames=FIELDNAMES)
+    writer.writeheader()
+    jsonl_f = open(JSONL_FILENAME, "wb")
+
+    task_queue = queue.Queue()
+    for task in _TASKS:
+        task_queue.put(task)
+
+    image_queue = queue.Queue()
+    if aiohttp is not None:
+        # one batching thread; concurrency comes from aiohttp inside it
+        image_threads = [threading.Thread(target=image_batch_worker, args=(image_queue,), daemon=True)]
+    else:
+        image_threads = [
+            threading.Thread(target=image_worker, args=(image_queue,), daemon=True)
+            for _ in range(IMAGE_WORKER_COUNT)
+        ]
+    for t in image_threads:
+        t.start()
+
+    # one progress bar for the whole run, advanced once per keyword; a
+    # low refresh rate keeps rich's render lock off the workers' backs
+    progress = Progress(console=console, refresh_per_second=4, transient=True)
+    progress_task = progress.add_task("Scraping keywords", total=_TOTAL_TASKS)
+
+    workers = [
+        threading.Thread(
+            target=scrape_worker,
+            args=(task_queue, writer, csv_f, jsonl_f, results_lock, summary, image_queue,
+                  progress, progress_task)
+        )
+        for _ in range(WORKER_COUNT)
+    ]
     try:
-        for category, genders in CATEGORIES.items():
-            for gender, keywords in genders.items():
-                for keyword in keywords:
-                    console.print(Panel(f"[bold green]Searching keyword:[/bold green] {keyword}"))
-                    driver.get(SEARCH_URL + keyword)
-                    time.sleep(2 + random.random()*1.5)
-                    items = infinite_scroll_load_all(driver, "a.flex.flex-col.gap-3.w-full")
-                    console.print(f"[bold blue]Found {len(items)} products for '{keyword}'[/bold blue]")
-                    summary[keyword] = len(items)
-
-                    for el in items:
-                        pdata = parse_culture_item(el, category, gender)
-                        all_products.append(pdata)
-                        if DOWNLOAD_IMAGES and pdata.get("image_url"):
-                            folder_path, img_name = generate_image_names(
-                                pdata.get("product_name"), pdata.get("brand"), category, gender
-                            )
-                            download_image(pdata["image_url"], folder_path, img_name)
-
-        # Save outputs
-        df = pd.DataFrame(all_products)
-        df.to_csv(CSV_FILENAME, index=False)
-        with open(JSON_FILENAME, "w", encoding="utf-8") as f:
-            json.dump(all_products, f, ensure_ascii=False, indent=2)
-
-        console.print(Panel(f"[bold blue]Scraping completed! Products saved to CSV and JSON[/bold blue]"))
-        for k, v in summary.items():
-            console.print(f"[green]{k}: {v} products scraped[/green]")
-        console.print(f"[bold yellow]Total Products Scraped: {len(all_products)}[/bold yellow]")
+        with progress:
+            for t in workers:
+                t.start()
+            for t in workers:
+                t.join()
 
+        # let the download backlog drain, then release the image workers
+        image_queue.join()
+        for _ in image_threads:
+            image_queue.put(None)
+        for t in image_threads:
+            t.join()
     finally:
-        driver.quit()
+        jsonl_f.close()
+        csv_f.close()
+
+    # one streaming pass turns the crash-safe JSONL into the JSON array
+    # downstream consumers expect, without loading every row back in
+    with open(JSONL_FILENAME, "rb") as src, open(JSON_FILENAME, "wb") as dst:
+        dst.write(b'[\n')
+        first = True
+        for line in src:
+            line = line.strip()
+            if not line:
+                continue
+            if not first:
+                dst.write(b',\n')
+            dst.write(line)
+            first = False
+        dst.write(b'\n]\n')
+
+    total_products = sum(summary.values())
+    console.print(Panel(f"[bold blue]Scraping completed! Products saved to CSV and JSON[/bold blue]"))
+    for k, v in summary.items():
+        console.print(f"[green]{k}: {v} products scraped[/green]")
+    console.print(f"[bold yellow]Total Products Scraped: {total_products}[/bold yellow]")
 
 if __name__ == "__main__":
     scrape_culture_circle()
@@ -1,28 +1,38 @@
 import os
+import sys
 
-def print_tree(root_dir, output_file=None, sample_files=5):
-    tree_lines = []
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        depth = dirpath.replace(root_dir, "").count(os.sep)
-        indent = "    " * depth
-        tree_lines.append(f"{indent}{os.path.basename(dirpath)}/")
+def _walk(fh, path, depth, sample_files):
+    indent = "    " * depth
+    fh.write(f"{indent}{os.path.basename(path) or path}/\n")
 
-        # Only show up to sample_files files
-        for f in filenames[:sample_files]:
-            tree_lines.append(f"{indent}    {f}")
+    subdirs = []
+    shown = 0
+    extra = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif shown < sample_files:
+                fh.write(f"{indent}    {entry.name}\n")
+                shown += 1
+            else:
+                extra += 1
 
-        # If more files exist, show summary
-        if len(filenames) > sample_files:
-            tree_lines.append(f"{indent}    [+ {len(filenames) - sample_files} more files]")
+    # If more files exist, show summary
+    if extra:
+        fh.write(f"{indent}    [+ {extra} more files]\n")
 
-    tree_text = "\n".join(tree_lines)
+    for subdir in subdirs:
+        _walk(fh, subdir, depth + 1, sample_files)
 
+def print_tree(root_dir, output_file=None, sample_files=5):
+    # lines stream straight to the destination; no intermediate list
     if output_file:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(tree_text)
+        with open(output_file, "w", encoding="utf-8") as fh:
+            _walk(fh, root_dir, 0, sample_files)
         print(f"[+] Project structure saved to {output_file}")
     else:
-        print(tree_text)
+        _walk(sys.stdout, root_dir, 0, sample_files)
 
 
 if __name__ == "__main__":
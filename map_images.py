@@ -4,15 +4,24 @@ import os
 root_dir = r"D:\CultureCircle-Scraper\CultureCircle-Scraper\culturecircle_scrape_20250918_094210\images"
 
 # Allowed image extensions
-image_extensions = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp')
+IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'})
 
-# Initialize count
-total_images = 0
+def count_images(root):
+    """Count image files under root with an iterative scandir walk.
 
-# Walk through all folders and files
-for foldername, subfolders, filenames in os.walk(root_dir):
-    for file in filenames:
-        if file.lower().endswith(image_extensions):
-            total_images += 1
+    DirEntry.is_dir uses the type cached by the directory read on most
+    platforms, so this avoids the per-file stat calls os.walk pays.
+    """
+    total = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTS:
+                    total += 1
+    return total
 
-print(f"Total number of images: {total_images}")
+if __name__ == "__main__":
+    print(f"Total number of images: {count_images(root_dir)}")